@@ -1,1156 +1,1960 @@
-from mathforlanguage import mathforlanguage, StringBeans, Arrays, Shmuple
-
-"""
-Muffasa Programming Language Interpreter
-
-This module implements the Muffasa programming language interpreter, including a lexer, parser, and interpreter.
-The language supports basic arithmetic operations, variable assignments, conditional statements, loops,
-and custom data structures like Shmuple, Arrays, and StringBeans.
-
-Classes:
-    Lexer: converts source code into tokens.
-    Parser: converts tokens into an abstract syntax tree.
-    Interpreter: executes the AST to run the program.
-
-Author: Lidor Tubul
-
-Date: 20.08.2024
-
-Version: 1.0
-"""
-
-
-# Lexer: Converts code into tokens for parsing
-class Lexer:
-    """
-    the lexer class is responsible for converting a string of code into a list of tokens
-    that the parser can use to generate the abstract syntax tree
-
-    attributes:
-        code (str): source code to be tokenized
-        position (int): current location of char in the source code
-    """
-
-    def __init__(self, code: str):
-        """
-        initialize the lexer with a given source code
-
-        parameter:
-            code (str): source code to be tokenized
-        """
-        self.code = code
-        self.position = 0
-
-    def get_next_char(self):
-        """
-        return the next character in the code or None if the end of the code is reached
-
-        return:
-            char (str or None): the next character in the source code or None if at the end
-        """
-        if self.position >= len(self.code):
-            return None
-        char = self.code[self.position]
-        self.position += 1
-        return char
-
-    def tokenize(self):
-        """
-        convert the source code into a list of tokens
-
-        returns:
-            list: a list of tuples, where each tuple represents a token in the format (token_type, token_value)
-
-        raise:
-            RuntimeError: if an unexpected character is not recognized during tokenization
-        """
-        tokens = []
-        while (char := self.get_next_char()) is not None:
-            if char.isspace():
-                continue  # skip whitespace
-            elif char.isalpha():  # identifiers and keywords
-                start = self.position - 1
-                while (char := self.get_next_char()) is not None and (char.isalnum() or char == '_'):
-                    continue
-                self.position -= 1
-                value = self.code[start:self.position]
-                if value in ['squareRoot', 'min', 'max']:
-                    tokens.append(('FUNC', value))
-                elif value in {'True', 'False'}:
-                    tokens.append(('BOOL', value))
-                elif value == 'if':
-                    tokens.append(("IF", value))
-                elif value == 'else':
-                    tokens.append(("ELSE", value))
-                elif value in {'while', "for"}:
-                    tokens.append(("LOOP", value))
-                elif value == 'break':
-                    tokens.append(("Terminate", value))
-                elif value == 'continue':
-                    tokens.append(("Continue", value))
-                elif value in {'Shmuple', 'StringBeans', 'Arrays'}:
-                    tokens.append(("Class", value))
-                else:
-                    tokens.append(('ID', value))  # identifiers (variable names, function names, etc.)
-            elif char.isdigit() or (char == '-' and
-                                    self.position < len(self.code) and self.code[self.position].isdigit()):  # Numbers
-                start = self.position - 1
-                while (char := self.get_next_char()) is not None and (char.isdigit() or char == '.'):
-                    continue
-                self.position -= 1
-                tokens.append(('NUMBER', self.code[start:self.position]))
-            elif char == '"':  # string literals
-                start = self.position
-                while (char := self.get_next_char()) != '"':
-                    if char is None:
-                        raise RuntimeError('Unterminated string literal')
-                tokens.append(('CHAR', self.code[start:self.position]))
-            elif char in '+-*/=<>!&|(){}^;,~':  # operators and symbols
-                if char == '^':
-                    tokens.append(('OP', '^'))
-                elif char == '=':
-                    if self.get_next_char() == '=':
-                        tokens.append(('OP', '=='))
-                    else:
-                        self.position -= 1
-                        tokens.append(('ASSIGN', '='))
-                elif char == '!':  # check for '!='
-                    if self.get_next_char() == '=':
-                        tokens.append(('OP', '!='))
-                    else:
-                        raise RuntimeError(f'Unexpected character {char!r} in char number: {self.position}')
-                elif char == '&':
-                    if self.get_next_char() == '&':
-                        tokens.append(('OP', '&&'))
-                    else:
-                        raise RuntimeError(f'Unexpected character {char!r} in char number: {self.position}')
-                elif char == '|':
-                    if self.get_next_char() == '|':
-                        tokens.append(('OP', '||'))
-                    else:
-                        raise RuntimeError(f'Unexpected character {char!r} in char number: {self.position}')
-                elif char in '+-*/':
-                    tokens.append(('OP', char))
-                elif char in '<>':
-                    tokens.append(('OP', char))
-                elif char in '(){}':
-                    tokens.append(('OP', char))
-                elif char == ',':
-                    tokens.append(('COMMA', ','))
-                elif char == '~':
-                    tokens.append(('END', '~'))
-                elif char == ';':
-                    tokens.append(('SEMICOLON', ';'))
-                else:
-                    raise RuntimeError(f'Unexpected character {char!r} in char number: {self.position}')
-            elif char == '.':  # dot operator
-                tokens.append(('DOT', '.'))
-            else:
-                raise RuntimeError(f'Unexpected character {char!r} in char number: {self.position}')
-        return tokens
-
-
-class Parser:
-    """
-    the parser class is responsible for converting a list of tokens into an abstract syntax tree that
-    represents the structure of the source code
-
-    attributes:
-        tokens (list of tuples): list of tokens generated by the lexer
-        position (int): current position in the list of tokens
-        tokenSize (int): size of the tokens generated by the lexer
-    """
-    def __init__(self, tokens: list):
-        """
-        initialize parser with a list of tokens
-
-        parameter:
-            tokens (list of tuples): list of tokens to be parsed
-        """
-        self.tokens = tokens
-        self.position = 0
-        self.tokenSize = len(tokens)
-
-    def current_token(self):
-        """
-        return current token in the list of tokens.
-
-        return:
-            token (tuple or None): current token as a tuple (token_type, token_value) or None if reached to the end
-        """
-        return self.tokens[self.position] if self.position < self.tokenSize else None
-
-    def consume(self, expected_type):
-        """
-        consume a current token if it matched the expected type and goes to the next token
-
-        parameter:
-            expected_type (str): expected type of the current token
-
-        return:
-            token_value (str): value of the token
-
-        raise:
-            RuntimeError: if the current token does not match the expected type
-        """
-        token = self.current_token()
-        if token and token[0] == expected_type:
-            self.position += 1
-            return token[1]
-        raise RuntimeError(f'Expected {expected_type} but got {token} in position number {self.position}')
-
-    def parse(self):
-        """
-        parse the list of tokens into abstract syntax tree
-
-        return:
-            ast (list): a list of parsed statements, each represented as a tuple
-        """
-        ast = []
-        while self.position < self.tokenSize:
-            ast.append(self.parse_statement())
-        return ast
-
-    def parse_statement(self):
-        """
-        parse a single statement from the current position in the token list
-
-        return:
-            tuple: tuple representing the parsed statement
-
-        raise:
-            RuntimeError: if unexpected token found or if the statement isn't terminated properly
-        """
-        token = self.current_token()
-        if token[0] == 'CHAR':  # handle string literals (comments)
-            self.consume('CHAR')
-            return 'COMMENT', token[1]  # return comments as a special type of statement
-        elif token[0] == 'Terminate':  # handle break statements
-            self.consume('Terminate')
-            if self.current_token() and self.current_token()[0] in ['END', 'SEMICOLON']:
-                self.consume(self.current_token()[0])
-            return ('BREAK',)
-        elif token[0] == 'Continue':  # handle continue statements
-            self.consume('Continue')
-            if self.current_token() and self.current_token()[0] in ['END', 'SEMICOLON']:
-                self.consume(self.current_token()[0])
-            return ('CONTINUE',)
-        elif token[0] == 'ID':
-            var_name = self.consume('ID')
-            if self.current_token()[0] == 'ASSIGN':
-                self.consume('ASSIGN')
-                expr = self.parse_expression()
-                if self.current_token() and self.current_token()[0] in ['END', 'SEMICOLON']:
-                    self.consume(self.current_token()[0])
-                else:
-                    raise RuntimeError(f"Expected '~' or ';' at the end of statement, got {self.current_token()}")
-                return 'ASSIGN', var_name, expr
-            elif self.current_token()[0] == 'DOT':
-                method_call = self.parse_method_call(var_name)
-                if self.current_token() and self.current_token()[0] in ['END', 'SEMICOLON']:
-                    self.consume(self.current_token()[0])
-                else:
-                    raise RuntimeError(f"Expected '~' or ';' at the end of statement, got {self.current_token()}")
-                return method_call
-            else:
-                expr = self.parse_expression()
-                if self.current_token() and self.current_token()[0] in ['END', 'SEMICOLON']:
-                    self.consume(self.current_token()[0])
-                else:
-                    raise RuntimeError(f"Expected '~' or ';' at the end of statement, got {self.current_token()}")
-                return expr
-        elif token[0] == 'IF':
-            return self.parse_if_statement()
-        elif token[0] == 'LOOP':
-            if token[1] == 'while':
-                return self.parse_while_statement()
-            elif token[1] == 'for':
-                return self.parse_for_statement()
-        else:
-            expr = self.parse_expression()
-            if self.current_token() and self.current_token()[0] in ['END', 'SEMICOLON']:
-                self.consume(self.current_token()[0])
-            else:
-                raise RuntimeError(f"Expected '~' or ';' at the end of statement, got {self.current_token()}")
-            return expr
-
-    def parse_expression(self):
-        """
-        parse expression that can be a combination of terms and operators
-
-        return:
-            tuple: tuple representing the parsed expression
-        """
-        left = self.parse_term()
-        while self.current_token() and self.current_token()[0] == 'OP' and self.current_token()[1] in ['+', '-', '<',
-                                                                                                       '>', '==', '!=',
-                                                                                                       '&&', '||']:
-            op = self.consume('OP')
-            right = self.parse_term()
-            left = (op, left, right)
-        return left
-
-    def parse_term(self):
-        """
-        parse a term that can be a combination of factors and operators
-
-        return:
-            tuple: tuple representing the parsed term
-        """
-        left = self.parse_factor()
-        while self.current_token() and self.current_token()[0] == 'OP' and self.current_token()[1] in ['*', '/', '^']:
-            op = self.consume('OP')
-            right = self.parse_factor()
-            left = (op, left, right)
-        return left
-
-    def parse_factor(self):
-        """
-        parse factor that can be a number, boolean, identifier, function call or nested expression
-
-        return:
-            tuple: tuple representing the parsed factor
-
-        Raise:
-            RuntimeError: if reached to unexpected token
-        """
-        if self.current_token()[0] == 'NUMBER':
-            return 'NUMBER', self.consume('NUMBER')
-        elif self.current_token()[0] == 'BOOL':
-            return 'BOOL', self.consume('BOOL')
-        elif self.current_token()[0] == 'ID':
-            return self.parse_id_or_call()
-        elif self.current_token()[0] == 'OP' and self.current_token()[1] == '(':
-            self.consume('OP')
-            expr = self.parse_expression()
-            self.consume('OP')
-            return expr
-        elif self.current_token()[0] == 'Class':
-            return self.parse_class_instantiation()
-        elif self.current_token()[0] == 'CHAR':
-            return 'CHAR', self.consume('CHAR')
-        elif self.current_token()[0] == 'FUNC':
-            return self.parse_function_call()  # could have pass current_token()[1] if I want to pass arg into func
-        else:
-            raise RuntimeError(f"Unexpected token {self.current_token()} in parse_factor")
-
-    def parse_id_or_call(self):
-        """
-        parse identifier that could be a variable or a function call
-
-        return:
-            tuple: tuple representing either identifier or a function call
-        """
-        var_name = self.consume('ID')
-        if self.current_token()[0] == 'OP' and self.current_token()[1] == '(':
-            return self.parse_function_call()  # var_name to func
-        elif self.current_token()[0] == 'DOT':
-            return self.parse_method_call(var_name)
-        return 'ID', var_name
-
-    def parse_function_call(self):
-        """
-        parse a function call including its arguments
-
-        return:
-            tuple: tuple representing the function call including the function name and its arguments
-        """
-        func_name = self.consume('FUNC')
-        self.consume('OP')  # '('
-        args = []
-        if self.current_token()[0] != 'OP' or self.current_token()[1] != ')':
-            args.append(self.parse_expression())
-            while self.current_token() and self.current_token()[0] == 'COMMA':
-                self.consume('COMMA')
-                args.append(self.parse_expression())
-        self.consume('OP')  # ')'
-        return 'CALL', func_name, args
-
-    def parse_method_call(self, obj_name):
-        """
-        parse a method call on an object including its arguments
-
-        parameter:
-            obj_name (str): name of the object on which the method is called
-
-        return:
-            tuple: tuple representing the method call including the object name, method name and arguments
-        """
-        self.consume('DOT')
-        method_name = self.consume('ID')
-        self.consume('OP')  # '('
-        args = []
-        if self.current_token()[0] != 'OP' or self.current_token()[1] != ')':
-            args.append(self.parse_expression())
-            while self.current_token()[0] == 'COMMA':
-                self.consume('COMMA')
-                args.append(self.parse_expression())
-        self.consume('OP')  # ')'
-        return 'METHOD_CALL', obj_name, method_name, args
-
-    def parse_class_instantiation(self):
-        """
-        parse a class instantiation including its arguments
-
-        return:
-            tuple: tuple representing the class instantiation including the class name and its arguments
-        """
-        class_name = self.consume('Class')
-        self.consume('OP')  # '('
-        args = []
-        if self.current_token()[0] != 'OP' or self.current_token()[1] != ')':
-            args.append(self.parse_expression())
-            while self.current_token()[0] == 'COMMA':
-                self.consume('COMMA')
-                args.append(self.parse_expression())
-        self.consume('OP')  # ')'
-        return 'CLASS_INST', class_name, args
-
-    def parse_bool_statement(self):
-        """
-        parse a boolean statement from the tokens
-
-        return:
-            bool_statement (tuple): tuple representing the parsed boolean statement
-        """
-        bool_expr = self.parse_expression()
-        return 'BOOL', bool_expr
-
-    def parse_if_statement(self):
-        """
-        parse if statement including the condition, if-body, and optional else-body
-        handle both cases of if (alone) and if-else
-
-        return:
-            tuple: tuple representing the if statement structure
-        """
-        self.consume('IF')
-        self.consume('OP')  # '('
-        condition = self.parse_expression()
-        self.consume('OP')  # ')'
-        self.consume('OP')  # '{'
-        if_body = []
-        while self.current_token() and not (self.current_token()[0] == 'OP' and self.current_token()[1] == '}'):
-            if_body.append(self.parse_statement())
-        self.consume('OP')  # '}'
-
-        if self.current_token() and self.current_token()[0] == 'ELSE':
-            self.consume('ELSE')
-            self.consume('OP')  # '{'
-            else_body = []
-            while self.current_token() and not (self.current_token()[0] == 'OP' and self.current_token()[1] == '}'):
-                else_body.append(self.parse_statement())
-            self.consume('OP')  # '}'
-            return 'IF_ELSE', condition, if_body, else_body
-
-        return 'IF', condition, if_body
-
-    def parse_while_statement(self):
-        """
-        parse a while loop including the condition and loop body
-
-        return:
-            tuple: tuple representing the while loop structure
-        """
-        self.consume('LOOP')  # 'while'
-        self.consume('OP')  # '('
-        condition = self.parse_expression()
-        self.consume('OP')  # ')'
-        self.consume('OP')  # '{'
-        while_body = []
-        while self.current_token() and not (self.current_token()[0] == 'OP' and self.current_token()[1] == '}'):
-            stmt = self.parse_statement()
-            if stmt is not None:  # This line ensures that comments (which are None) are not added to the body
-                while_body.append(stmt)
-        self.consume('OP')  # '}'
-        return 'WHILE', condition, while_body
-
-    def parse_for_statement(self):
-        """
-        parse a for loop including initialization, condition, increment and loop body
-
-        return:
-            tuple: tuple representing for loop structure
-        """
-        self.consume('LOOP')  # 'for'
-        self.consume('OP')  # '('
-
-        # Parse initialization
-        init_var = self.consume('ID')
-        self.consume('ASSIGN')
-        init_expr = self.parse_expression()
-        self.consume('SEMICOLON')
-
-        # Parse condition
-        condition = self.parse_expression()
-        self.consume('SEMICOLON')
-
-        # Parse increment
-        incr_var = self.consume('ID')
-        self.consume('ASSIGN')
-        incr_expr = self.parse_expression()
-
-        self.consume('OP')  # ')'
-        self.consume('OP')  # '{'
-
-        for_body = []
-        while self.current_token() and not (self.current_token()[0] == 'OP' and self.current_token()[1] == '}'):
-            for_body.append(self.parse_statement())
-        self.consume('OP')  # '}'
-
-        init = ('ASSIGN', init_var, init_expr)
-        increment = ('ASSIGN', incr_var, incr_expr)
-        return 'FOR', init, condition, increment, for_body
-
-
-class Interpreter:
-    """
-    the interpreter class is responsible for executing the abstract syntax tree
-    generated by the parser. It handles variable assignment, control flow, and
-    expression evaluation.
-
-    Attributes:
-        variables (dict): stores variable names and their values
-        math (mathforlanguage): instance of math operations class
-        current_statement: keep track of the statement being executed
-    """
-    def __init__(self):
-        """
-        initializes the interpreter with an empty variable dictionary and a
-        math operations instances.
-        """
-        self.variables = {}
-        self.math = mathforlanguage()
-        self.current_statement = None
-
-    def interpret(self, ast):
-        """
-        interprets the entire AST by executing each statement in order.
-
-        parameter:
-            ast (list): The abstract syntax tree to be interpreted
-        """
-        for statement in ast:
-            if statement is not None:
-                self.execute_statement(statement)
-
-    def execute_statement(self, statement):
-        """
-        Executes a single statment based on its type.
-
-        parameter:
-            statement (tuple): a tuple representing the statement to be executed
-
-        Returns:
-            the result of the statement execution, if applicable
-        """
-        self.current_statement = statement
-        statement_type = statement[0]
-        if statement_type == 'ASSIGN':
-            self.execute_assignment(statement)
-        elif statement_type == 'IF_ELSE':
-            self.execute_if_else(statement)
-        elif statement_type == 'WHILE':
-            self.execute_while(statement)
-        elif statement_type == 'FOR':
-            self.execute_for(statement)
-        elif statement_type == 'METHOD_CALL':
-            return self.execute_method_call(statement)
-        elif statement_type == 'CLASS_INST':
-            return self.execute_class_instantiation(statement)
-        elif statement_type == 'ID':
-            var_name = statement[1]
-            if var_name not in self.variables:
-                raise NameError(f"Name '{var_name}' is not defined")
-            return self.variables[var_name]
-        elif statement_type == 'BREAK':
-            return 'BREAK'
-        elif statement_type == 'CONTINUE':
-            return 'CONTINUE'
-        elif statement_type == 'COMMENT':
-            pass  # Do nothing for comments
-
-    def execute_assignment(self, statement):
-        """
-        executes an assignment statement, storing the value in the variables' dictionary.
-
-        Parameter:
-            statement (tuple): the assignment statement to execute
-
-        This method handles different types of assignments
-        and variable references.
-        """
-        _, var_name, expr = statement
-        if isinstance(expr, tuple) and expr[0] == 'CLASS_INST':
-            value = self.execute_class_instantiation(expr)
-        elif isinstance(expr, tuple) and expr[0] == 'ID':
-            var_name_expr = expr[1]
-            if var_name_expr not in self.variables:
-                raise NameError(f"Name '{var_name_expr}' is not defined")
-            value = self.variables[var_name_expr]
-        else:
-            value = self.evaluate_expression(expr)
-        if isinstance(value, StringBeans):
-            self.variables[var_name] = value.__copy__()
-        elif isinstance(value, bool):
-            self.variables[var_name] = value
-        else:
-            self.variables[var_name] = value
-        self.math.assign(var_name, value)
-
-    def execute_if_else(self, statement): 
-        """
-        executes an if-else statement, handling both if and if-else constructs.
-
-        parameter:
-            statement (tuple): the if or if-else statement to execute
-
-        this method manages the scope of variables created within the if and else blocks,
-        removing them after execution.
-        """
-        if_variables = set()  # track variables assigned in the if block
-        else_variables = set()  # track variables assigned in the else block
-
-        if statement[0] == 'IF':
-            _, condition, if_body = statement
-            else_body = []
-        else:  # IF_ELSE
-            _, condition, if_body, else_body = statement
-
-        if self.evaluate_expression(condition):
-            for stmt in if_body:
-                if isinstance(stmt, tuple) and stmt[0] == 'ASSIGN':
-                    var_name = stmt[1]
-                    if_variables.add(var_name)
-                result = self.execute_statement(stmt)
-                if result in ['BREAK', 'CONTINUE']:
-                    return result
-        else:
-            for stmt in else_body:
-                if isinstance(stmt, tuple) and stmt[0] == 'ASSIGN':
-                    var_name = stmt[1]
-                    else_variables.add(var_name)
-                result = self.execute_statement(stmt)
-                if result in ['BREAK', 'CONTINUE']:
-                    return result
-
-        # remove variables assigned in the if block that are not used outside the block
-        for var_name in if_variables:
-            if var_name not in self.current_statement and var_name not in else_variables:
-                del self.variables[var_name]
-
-        # remove variables assigned in the else block that are not used outside the block
-        for var_name in else_variables:
-            if var_name not in self.current_statement and var_name not in if_variables:
-                del self.variables[var_name]
-
-        return None
-
-    def execute_while(self, statement):
-        """
-        executes a while loop statement.
-
-        parameter:
-            statement (tuple): while loop statement to execute
-
-        this method manages the execution of the loop body, handling break and continue
-        statements, and removes variables created within the loop after execution.
-        """
-        _, condition, body = statement
-        loop_variables = set()  # track variables created in the loop
-
-        while self.evaluate_expression(condition):
-            should_break = False
-            should_continue = False
-            for stmt in body:
-                if isinstance(stmt, tuple):
-                    if stmt[0] == 'ASSIGN':
-                        var_name = stmt[1]
-                        if var_name not in self.variables:
-                            loop_variables.add(var_name)
-                    elif stmt[0] == 'BREAK':
-                        should_break = True
-                        break
-                    elif stmt[0] == 'CONTINUE':
-                        should_continue = True
-                        break
-                    elif stmt[0] == 'COMMENT':
-                        continue  # skip comments
-                    elif stmt[0] in ['IF', 'IF_ELSE']:
-                        result = self.execute_if_else(stmt)
-                        if result == 'BREAK':
-                            should_break = True
-                            break
-                        elif result == 'CONTINUE':
-                            should_continue = True
-                            break
-                        continue
-                result = self.execute_statement(stmt)
-                if result == 'BREAK':
-                    should_break = True
-                    break
-                elif result == 'CONTINUE':
-                    should_continue = True
-                    break
-            if should_break:
-                break
-            if should_continue:
-                continue
-
-        # remove variables created inside the loop
-        for var_name in loop_variables:
-            if var_name in self.variables:
-                del self.variables[var_name]
-
-    def execute_for(self, statement):
-        """
-        executes a for loop statement.
-
-        parameter:
-            statement (tuple): for a loop statement to execute
-
-        this method manages the execution of the loop body, handling break and continue
-        statements and removes variables created within the loop after execution.
-        """
-        _, init, condition, increment, body = statement
-        loop_variables = set()  # Track variables created inside the loop
-
-        # check if the loop counter-variable already exists in the global scope
-        loop_counter = init[1]
-        loop_counter_exists = loop_counter in self.variables
-
-        self.execute_statement(init)
-
-        while self.evaluate_expression(condition):
-            should_break = False
-            should_continue = False
-            for stmt in body:
-                if isinstance(stmt, tuple):
-                    if stmt[0] == 'ASSIGN':
-                        var_name = stmt[1]
-                        if var_name not in self.variables:
-                            loop_variables.add(var_name)
-                    elif stmt[0] == 'BREAK':
-                        should_break = True
-                        break
-                    elif stmt[0] == 'CONTINUE':
-                        should_continue = True
-                        break
-                    elif stmt[0] in ['IF', 'IF_ELSE']:
-                        result = self.execute_if_else(stmt)
-                        if result == 'BREAK':
-                            should_break = True
-                            break
-                        elif result == 'CONTINUE':
-                            should_continue = True
-                            break
-                        continue
-                result = self.execute_statement(stmt)
-                if result == 'BREAK':
-                    should_break = True
-                    break
-                elif result == 'CONTINUE':
-                    should_continue = True
-                    break
-
-            if should_break:
-                break
-
-            # execute the increment statement even if continue was encountered
-            self.execute_statement(increment)
-
-            if should_continue:
-                continue
-
-        # Remove variables created inside the loop
-        for var_name in loop_variables:
-            del self.variables[var_name]
-
-        # Remove the loop counter variable if it was created within the loop
-        if not loop_counter_exists:
-            del self.variables[loop_counter]
-
-    def execute_method_call(self, statement):
-        """
-        executes a method call.
-
-        parameter:
-            statement (tuple): The method call statement to execute
-
-        """
-        _, obj_name, method_name, args = statement
-        obj = self.variables.get(obj_name)
-        if obj is None:
-            raise NameError(f"Name '{obj_name}' is not defined")
-
-        method = getattr(obj, method_name, None)
-        if method is None:
-            raise AttributeError(f"'{type(obj).__name__}' object has no attribute '{method_name}'")
-
-        evaluated_args = [self.evaluate_expression(arg) for arg in args]
-        result = method(*evaluated_args)
-
-        if isinstance(self.current_statement, tuple) and self.current_statement[0] == 'ASSIGN':
-            var_name = self.current_statement[1]
-            self.variables[var_name] = result
-        elif method_name == 'display':
-            print(f"{obj_name} = {result}")
-        elif method_name == 'splitBeans':
-            # when splitBeans is called without assignment we'll print the result
-            print(f"{result.display()}")
-
-        return result
-
-    def evaluate_expression(self, expr):
-        """
-        evaluates an expression and returns its value.
-
-        parameter:
-            expr: The expression to evaluate
-
-        this method handles various types of expressions, including math
-        operations, functions, and variables.
-        """
-        if isinstance(expr, tuple):
-            if expr[0] in {'+', '-', '*', '/', '==', '<', '>', '^', 'CALL', 'METHOD_CALL', '!=', '&&', '||'}:
-                if expr[0] == 'CALL':
-                    return self.execute_function_call(expr)
-                elif expr[0] == 'METHOD_CALL':
-                    return self.execute_method_call(expr)
-                elif expr[0] in {'&&', '||'}:
-                    left = self.to_bool(self.evaluate_expression(expr[1]))
-                    right = self.to_bool(self.evaluate_expression(expr[2]))
-                    return self.apply_operator(expr[0], left, right)
-                else:
-                    left = self.evaluate_expression(expr[1])
-                    right = self.evaluate_expression(expr[2])
-                    return self.apply_operator(expr[0], left, right)
-            elif expr[0] == 'ID':
-                return self.variables.get(expr[1], 0)
-            elif expr[0] == 'NUMBER':
-                return int(expr[1])
-            elif expr[0] == 'BOOL':
-                return expr[1] == 'True'
-            elif expr[0] == 'CHAR':
-                return expr[1].strip('"')
-        return expr
-
-    def to_bool(self, value):
-        """
-        converts a value to a boolean.
-
-        parameter:
-            value: value to convert
-
-        returns:
-            bool: boolean representation of the value
-        """
-
-        if isinstance(value, bool):
-            return value
-        elif isinstance(value, (int, float)):
-            return bool(value)
-        elif isinstance(value, str):
-            return value.lower() == 'true'
-        else:
-            return bool(value)
-
-    def execute_function_call(self, expr):
-        """
-        executes a function call.
-
-        parameter:
-            expr (tuple): The function / class call expression
-        """
-        _, func_name, args = expr
-        if func_name == 'Shmuple':
-            return Shmuple(*[self.evaluate_expression(arg) for arg in args])
-        elif func_name == 'Arrays':
-            return Arrays(self.evaluate_expression(args[0]))
-        elif func_name == 'StringBeans':
-            return StringBeans(self.evaluate_expression(args[0]))
-        elif func_name == 'squareRoot':
-            return self.math.squareRoot(self.evaluate_expression(args[0]))
-        elif func_name == 'min':
-            return self.math.Min(self.evaluate_expression(args[0]), self.evaluate_expression(args[1]))
-        elif func_name == 'max':
-            return self.math.Max(self.evaluate_expression(args[0]), self.evaluate_expression(args[1]))
-        else:
-            raise NameError(f"Function '{func_name}' is not defined")
-
-    def execute_class_instantiation(self, statement):
-        """
-        executes a class instantiation.
-
-        parameter:
-            statement (tuple): The class instantiation statement
-
-        this method creates new instances of Shmuple, Arrays, or StringBeans classes.
-        """
-        _, class_name, args = statement
-        evaluated_args = [self.evaluate_expression(arg) for arg in args]
-        if class_name == 'Shmuple':
-            return Shmuple(*evaluated_args)
-        elif class_name == 'Arrays':
-            return Arrays(*evaluated_args)
-        elif class_name == 'StringBeans':
-            return StringBeans(*evaluated_args)
-        else:
-            raise NameError(f"Class '{class_name}' is not defined")
-
-    def apply_operator(self, op, left, right):
-        """
-        applies a binary operator to two operands.
-
-        parameters:
-            op (str): the operator
-            left: the left operand
-            right: the right operand
-
-        returns:
-            the result of the operation
-        """
-        if op == '+':
-            return self.math.Add(left, right)
-        elif op == '-':
-            return self.math.Subtract(left, right)
-        elif op == '*':
-            return self.math.Multiply(left, right)
-        elif op == '/':
-            return self.math.Divide(left, right)
-        elif op == '^':
-            return self.math.Pow(left, right)
-        elif op == '==':
-            return self.math.Equal(left, right)
-        elif op == '!=':
-            return self.math.notEqual(left, right)
-        elif op == '<':
-            return self.math.less(left, right)
-        elif op == '>':
-            return self.math.greater(left, right)
-        elif op == '&&':
-            return self.math.And(self.to_bool(left), self.to_bool(right))
-        elif op == '||':
-            return self.math.Or(self.to_bool(left), self.to_bool(right))
-
-    def print_variables(self):
-        """
-        prints all variables in the current scope.
-
-        displays the contents of the variables, this function only for the project tester
-        """
-        print("Variables:")
-        for var, value in self.variables.items():
-            if isinstance(value, Shmuple):
-                print(f"{var} = {value}")
-            elif isinstance(value, Arrays):
-                print(f"{var} = {value.display()}")
-            elif isinstance(value, StringBeans):
-                print(f"{var} = {value}")
-            elif isinstance(value, str):
-                print(f"{var} = \"{value}\"")
-            else:
-                print(f"{var} = {value}")
-
-
-if __name__ == "__main__":
-    # test code
-    code1 = """
-    "בשפה הזאת אפשר לכתוב הערות כסטרינג רגיל בשורה נפרדת"
-    "כאן בדיקה לשמאפל"
-    sh = Shmuple(1, 3, 2, 0, -7)~
-    sh_sorted = sh.sortuple()~
-    sh2 = Shmuple(-8, 6)~
-    sh1 = sh.Add(sh2)~
-    sh1 = sh1.sortuple()~
-    item = sh1.getitem(5)~
-    shin = sh1.Index(0)~
-    shlen = sh1.Length()~ 
-    
-    "כאן בדיקה למערכים"
-    arr = Arrays(5)~
-    arr.add(10)~
-    arr.insert(0, "5")~
-    arr_len = arr.length()~
-    item_arr = arr.at(0)~
-    arr.remove(1)~
-    arr.display()~
-    
-    "בדיקה לסטרינגים"
-    strb = StringBeans("hello");
-    strb.show();
-    newstrb = strb;
-    strb.Replace("h", "hi");
-    strb.show();
-    newstrb.show();
-    a = newstrb.allUpper();
-    b = newstrb.allLower();
-    newstrb.Conjoin(" ast");
-    
-    "קצת פעולות אריתמטיות, תנאים ולולאות בקוד 2"
-    c = 5;
-    t = 7;
-    c = c - t;
-    u = 5*2;
-    U = t*c;
-    "add min max functionality"
-    T = min(10, 2)~
-    P = max(10, 2)~
-    L = squareRoot(100)~
-    O = c^4~
-    """
-
-    code2 = """
-    x = 520156~
-    y = 3~
-    if (x != 5)
-    {
-        z = x + y~
-    }
-    else
-    {
-        p = x - y~
-    }
-    "There is no else-if duo to the fact there was no requirement"
-    "need to fix break and comments in loops"
-    while (y < 10)
-    {
-        y = y + 1~
-        q = 5~
-    }
-    for (i = 1; i < 10 ; i = i + 1)
-    {
-        y = y + i~
-        p = y~
-    }
-    
-    l = y < x;
-    n = z > y;
-    c =  l && n;
-    e = False;
-    f = True;
-    t = e || f;
-    """
-
-    # this code supposed to fail
-    code3 = """
-    x = 1~
-    else
-    {
-        x = x + 1~
-    }
-    """
-
-    code4 = """
-    str1 = StringBeans("Hello,World,How,Are,You")~
-    arr1 = str1.splitBeans(",")~
-    arr1.display()~
-    
-    str2 = StringBeans("This is a test")~
-    arr2 = str2.splitBeans(" ")~
-    arr2.display()~
-    
-    "Test splitBeans without assignment"
-    str3 = StringBeans("One|Two|Three")~
-    str3.splitBeans("|")~
-    
-    y = 0~
-    sum = 0~
-    z = 0~
-    while (y < 10)
-    {
-        "comment1"
-        y = y + 2~
-        sum = sum + 1~
-        "comment2"
-        if (y > 3)
-        {
-            p = 400~
-        }
-        break;
-        
-    }
-    for (i = 4; i < 10 ; i = i + 1)
-    {
-        y = i + i~
-        p = y~
-        if(y < 3)
-        {
-            continue;
-        }
-        else
-        {
-            break;
-        }
-    }
-    
-"""
-
-    # create interpreter instance
-    interpreter = Interpreter()
-
-    # initialize lexer and parser for code1
-    lexer1 = Lexer(code1)
-    tokens1 = lexer1.tokenize()
-    print("Testing code1:")
-    print("Tokens:", tokens1)
-
-    parser1 = Parser(tokens1)
-    try:
-        # parse and interpreter code1
-        ast1 = parser1.parse()
-        print("AST:", ast1)
-        interpreter.interpret(ast1)
-        interpreter.print_variables()
-    except RuntimeError as e:
-        print(f"Error: {e}")
-
-    # initialize lexer and parser for code2
-    lexer2 = Lexer(code2)
-    tokens2 = lexer2.tokenize()
-    print("Testing code2:")
-    print("Tokens:", tokens2)
-
-    parser2 = Parser(tokens2)
-
-    # create new interpreter instance for code2
-    interpreter2 = Interpreter()
-    try:
-        # parse and interprit code2
-        ast2 = parser2.parse()
-        print("AST:", ast2)
-        interpreter2.interpret(ast2)
-        interpreter2.print_variables()
-    except RuntimeError as e:
-        print(f"Error: {e}")
-
-    # initialize lexer and parser for code3
-    lexer3 = Lexer(code3)
-    tokens3 = lexer3.tokenize()
-    print("Testing code3:")
-    print("Tokens:", tokens3)
-
-    # we did not create interpreter for code3 because parser ment to fail
-    parser3 = Parser(tokens3)
-    try:
-        # attempt to parse code3 (expected to fail)
-        ast3 = parser3.parse()
-        print("AST:", ast3)
-    except RuntimeError as e:
-        print(f"Error: {e}")
-
-    # create a new interpreter instance for code4
-    int3 = Interpreter()
-    lexer4 = Lexer(code4)
-    tokens4 = lexer4.tokenize()
-    parser4 = Parser(tokens4)
-    print("Testing code4:")
-    print("Tokens:", tokens4)
-    try:
-        # parse and interpreter code4
-        ast4 = parser4.parse()
-        print("AST:", ast4)
-        int3.interpret(ast4)
-        int3.print_variables()
-    except RuntimeError as e:
-        print(f"Error: {e}")
+import hashlib
+import operator
+import os
+import pickle
+import re
+import sys
+
+try:
+    import numba
+except ImportError:  # numba is an optional extra, lowered loops run fine without it
+    numba = None
+
+try:
+    import numpy
+except ImportError:  # numpy is an optional extra, loops run interpreted without it
+    numpy = None
+
+from mathforlanguage import mathforlanguage, StringBeans, Arrays, Shmuple
+
+"""
+Muffasa Programming Language Interpreter
+
+This module implements the Muffasa programming language interpreter, including a lexer, parser, and interpreter.
+The language supports basic arithmetic operations, variable assignments, conditional statements, loops,
+and custom data structures like Shmuple, Arrays, and StringBeans.
+
+Classes:
+    Lexer: converts source code into tokens.
+    Parser: converts tokens into an abstract syntax tree.
+    Interpreter: executes the AST to run the program.
+
+Author: Lidor Tubul
+
+Date: 20.08.2024
+
+Version: 1.0
+"""
+
+
+# single alternation pattern that matches a whole token per regex match, so the scan
+# runs inside the regex engine instead of one python-level loop iteration per character
+TOKEN_RE = re.compile(
+    r'(?P<WS>\s+)'
+    r'|(?P<ID>[A-Za-z_][A-Za-z0-9_]*)'
+    r'|(?P<NUMBER>-?\d+(?:\.\d+)?)'
+    r'|(?P<STRING>"[^"]*")'
+    r'|(?P<OP2>==|!=|&&|\|\|)'
+    r'|(?P<OP1>[-+*/<>(){}^])'
+    r'|(?P<COMMA>,)'
+    r'|(?P<END>~)'
+    r'|(?P<SEMICOLON>;)'
+    r'|(?P<DOT>\.)'
+    r'|(?P<ASSIGN>=)'
+)
+
+# reserved words mapped straight to their finished token, so classifying an
+# identifier is a single dict lookup instead of a chain of membership tests
+_KEYWORDS = {
+    'squareRoot': ('FUNC', 'squareRoot'),
+    'min': ('FUNC', 'min'),
+    'max': ('FUNC', 'max'),
+    'True': ('BOOL', 'True'),
+    'False': ('BOOL', 'False'),
+    'if': ('IF', 'if'),
+    'else': ('ELSE', 'else'),
+    'while': ('LOOP', 'while'),
+    'for': ('LOOP', 'for'),
+    'break': ('Terminate', 'break'),
+    'continue': ('Continue', 'continue'),
+    'Shmuple': ('Class', 'Shmuple'),
+    'StringBeans': ('Class', 'StringBeans'),
+    'Arrays': ('Class', 'Arrays'),
+}
+
+# binary operators grouped by precedence level, as frozensets so the parser
+# membership test is a single O(1) hash lookup
+# operator precedence levels; comparisons, logic and additive operators all
+# bind at the lowest level and '*', '/', '^' one above, matching the old
+# expression/term grammar split
+_PREC = {'+': 1, '-': 1, '<': 1, '>': 1, '==': 1, '!=': 1, '&&': 1, '||': 1,
+         '*': 2, '/': 2, '^': 2}
+
+# token-type strings interned once, so hot-path comparisons in the parser are
+# a single identity check instead of a character-by-character equality
+_TT_OP = sys.intern('OP')
+_TT_ID = sys.intern('ID')
+_TT_NUMBER = sys.intern('NUMBER')
+_TT_CHAR = sys.intern('CHAR')
+_TT_BOOL = sys.intern('BOOL')
+_TT_FUNC = sys.intern('FUNC')
+_TT_CLASS = sys.intern('Class')
+_TT_ASSIGN = sys.intern('ASSIGN')
+_TT_DOT = sys.intern('DOT')
+
+# marker stored in a slot whose variable is not currently defined
+_UNDEFINED = object()
+
+# control-flow sentinels returned by compiled break/continue closures; loop
+# closures recognize them with an identity compare, which is cheaper than the
+# old string equality and can never collide with a value a statement produces
+_BREAK = object()
+_CONTINUE = object()
+
+
+# Lexer: Converts code into tokens for parsing
+class Lexer:
+    """
+    the lexer class is responsible for converting a string of code into a list of tokens
+    that the parser can use to generate the abstract syntax tree
+
+    attributes:
+        code (str): source code to be tokenized
+        position (int): current location of char in the source code
+    """
+
+    __slots__ = ('code', 'position')
+
+    def __init__(self, code: str):
+        """
+        initialize the lexer with a given source code
+
+        parameter:
+            code (str): source code to be tokenized
+        """
+        self.code = code
+        self.position = 0
+
+    def tokenize(self):
+        """
+        convert the source code into two parallel lists of token types and
+        token values, kept in lockstep so the parser can index either one
+        without building a tuple per token
+
+        returns:
+            tuple: (types, values) where types[i] is the token type of the
+            token whose value is values[i]
+
+        raise:
+            RuntimeError: if an unexpected character is not recognized during tokenization
+        """
+        types = []
+        values = []
+        for match in TOKEN_RE.finditer(self.code):
+            if match.start() != self.position:  # a gap means a character no token pattern accepts
+                char = self.code[self.position]
+                if char == '"':
+                    raise RuntimeError('Unterminated string literal')
+                raise RuntimeError(f'Unexpected character {char!r} in char number: {self.position + 1}')
+            self.position = match.end()
+            kind = match.lastgroup
+            value = match.group()
+            if kind == 'WS':
+                continue  # skip whitespace
+            elif kind == 'ID':  # identifiers and keywords
+                keyword = _KEYWORDS.get(value)
+                if keyword is not None:
+                    types.append(keyword[0])
+                    values.append(keyword[1])
+                else:
+                    types.append('ID')
+                    values.append(value)
+                continue
+            elif kind == 'NUMBER':
+                types.append('NUMBER')
+                values.append(value)
+            elif kind == 'STRING':
+                types.append('CHAR')
+                values.append(value[1:-1])  # string literals without the surrounding quotes
+            elif kind in ('OP2', 'OP1'):
+                types.append('OP')
+                values.append(value)
+            else:  # COMMA, END, SEMICOLON, DOT and ASSIGN map straight to their token type
+                types.append(sys.intern(kind))  # group names are not interned by re
+                values.append(value)
+        if self.position != len(self.code):
+            char = self.code[self.position]
+            if char == '"':
+                raise RuntimeError('Unterminated string literal')
+            raise RuntimeError(f'Unexpected character {char!r} in char number: {self.position + 1}')
+        return types, values
+
+
+class Parser:
+    """
+    the parser class is responsible for converting a list of tokens into an abstract syntax tree that
+    represents the structure of the source code
+
+    attributes:
+        types (list of str): token types generated by the lexer
+        values (list of str): token values parallel to types
+        position (int): current position in the token arrays
+        tokenSize (int): number of tokens generated by the lexer
+        _memo (dict): packrat table mapping (nonterminal, position) to the
+            parsed result and the position after it
+    """
+
+    __slots__ = ('types', 'values', 'position', 'tokenSize', '_memo')
+
+    # memoization key for parse_factor; parse_expression keys on its
+    # minimum precedence, which is always at least 1
+    _FACTOR = 0
+
+    def __init__(self, tokens: tuple):
+        """
+        initialize parser with the token arrays produced by the lexer
+
+        parameter:
+            tokens (tuple): the (types, values) pair returned by Lexer.tokenize
+        """
+        self.types, self.values = tokens
+        self.position = 0
+        self.tokenSize = len(self.types)
+        self._memo = {}
+
+    def current_token(self):
+        """
+        return current token in the list of tokens.
+
+        return:
+            token (tuple or None): current token as a tuple (token_type, token_value) or None if reached to the end
+        """
+        position = self.position
+        return (self.types[position], self.values[position]) if position < self.tokenSize else None
+
+    def consume(self, expected_type):
+        """
+        consume a current token if it matched the expected type and goes to the next token
+
+        parameter:
+            expected_type (str): expected type of the current token
+
+        return:
+            token_value (str): value of the token
+
+        raise:
+            RuntimeError: if the current token does not match the expected type
+        """
+        position = self.position
+        if position < self.tokenSize and self.types[position] == expected_type:
+            self.position = position + 1
+            return self.values[position]
+        raise RuntimeError(f'Expected {expected_type} but got {self.current_token()} in position number {self.position}')
+
+    def parse(self):
+        """
+        parse the list of tokens into abstract syntax tree
+
+        return:
+            ast (list): a list of parsed statements, each represented as a tuple
+        """
+        ast = []
+        while self.position < self.tokenSize:
+            stmt = self.parse_statement()
+            if stmt is not None:  # comments produce no statement
+                ast.append(stmt)
+        return ast
+
+    def parse_statement(self):
+        """
+        parse a single statement from the current position in the token list
+
+        return:
+            tuple: tuple representing the parsed statement
+
+        raise:
+            RuntimeError: if unexpected token found or if the statement isn't terminated properly
+        """
+        token = self.current_token()
+        if token[0] == 'CHAR':  # handle string literals (comments)
+            self.consume('CHAR')
+            return None  # comments are dropped here so the interpreter never sees them
+        elif token[0] == 'Terminate':  # handle break statements
+            self.consume('Terminate')
+            ending = self.current_token()
+            if ending and ending[0] in ['END', 'SEMICOLON']:
+                self.consume(ending[0])
+            return ('BREAK',)
+        elif token[0] == 'Continue':  # handle continue statements
+            self.consume('Continue')
+            ending = self.current_token()
+            if ending and ending[0] in ['END', 'SEMICOLON']:
+                self.consume(ending[0])
+            return ('CONTINUE',)
+        elif token[0] == 'ID':
+            var_name = self.consume('ID')
+            following = self.current_token()
+            if following[0] is _TT_ASSIGN:
+                self.consume('ASSIGN')
+                expr = self.parse_expression()
+                self.consume_statement_end()
+                return 'ASSIGN', var_name, expr
+            elif following[0] is _TT_DOT:
+                method_call = self.parse_method_call(var_name)
+                self.consume_statement_end()
+                return method_call
+            else:
+                expr = self.parse_expression()
+                self.consume_statement_end()
+                return expr
+        elif token[0] == 'IF':
+            return self.parse_if_statement()
+        elif token[0] == 'LOOP':
+            if token[1] == 'while':
+                return self.parse_while_statement()
+            elif token[1] == 'for':
+                return self.parse_for_statement()
+        else:
+            expr = self.parse_expression()
+            self.consume_statement_end()
+            return expr
+
+    def consume_statement_end(self):
+        """
+        consume the '~' or ';' that terminates a statement
+
+        raise:
+            RuntimeError: if the statement isn't terminated properly
+        """
+        ending = self.current_token()
+        if ending and ending[0] in ['END', 'SEMICOLON']:
+            self.consume(ending[0])
+        else:
+            raise RuntimeError(f"Expected '~' or ';' at the end of statement, got {ending}")
+
+    def parse_expression(self, min_prec=1):
+        """
+        parse an expression with a single precedence-climbing loop instead of
+        one recursive method per precedence level
+
+        parameter:
+            min_prec (int): lowest operator precedence this call may consume
+
+        return:
+            tuple: tuple representing the parsed expression
+        """
+        key = (min_prec, self.position)
+        memo = self._memo.get(key)
+        if memo is not None:
+            left, self.position = memo
+            return left
+        left = self.parse_factor()
+        types = self.types
+        values = self.values
+        while (self.position < self.tokenSize and types[self.position] is _TT_OP
+                and _PREC.get(values[self.position], 0) >= min_prec):
+            prec = _PREC[values[self.position]]
+            op = self.consume('OP')
+            right = self.parse_expression(prec + 1)
+            left = (op, left, right)
+        self._memo[key] = (left, self.position)
+        return left
+
+    def parse_factor(self):
+        """
+        parse factor that can be a number, boolean, identifier, function call or nested expression
+
+        return:
+            tuple: tuple representing the parsed factor
+
+        Raise:
+            RuntimeError: if reached to unexpected token
+        """
+        key = (self._FACTOR, self.position)
+        memo = self._memo.get(key)
+        if memo is not None:
+            result, self.position = memo
+            return result
+        result = self._parse_factor_inner()
+        self._memo[key] = (result, self.position)
+        return result
+
+    def _parse_factor_inner(self):
+        """
+        does the actual factor parsing for parse_factor, which only handles
+        the packrat bookkeeping around it
+
+        return:
+            tuple: tuple representing the parsed factor
+        """
+        token = self.current_token()
+        if token[0] is _TT_NUMBER:
+            return 'NUMBER', self.consume('NUMBER')
+        elif token[0] is _TT_BOOL:
+            return 'BOOL', self.consume('BOOL')
+        elif token[0] is _TT_ID:
+            return self.parse_id_or_call()
+        elif token[0] is _TT_OP and token[1] == '(':
+            self.consume('OP')
+            expr = self.parse_expression()
+            self.consume('OP')
+            return expr
+        elif token[0] is _TT_CLASS:
+            return self.parse_class_instantiation()
+        elif token[0] is _TT_CHAR:
+            return 'CHAR', self.consume('CHAR')
+        elif token[0] is _TT_FUNC:
+            return self.parse_function_call()  # could have pass current_token()[1] if I want to pass arg into func
+        else:
+            raise RuntimeError(f"Unexpected token {token} in parse_factor")
+
+    def parse_id_or_call(self):
+        """
+        parse identifier that could be a variable or a function call
+
+        return:
+            tuple: tuple representing either identifier or a function call
+        """
+        var_name = self.consume('ID')
+        token = self.current_token()
+        if token[0] is _TT_OP and token[1] == '(':
+            return self.parse_function_call()  # var_name to func
+        elif token[0] is _TT_DOT:
+            return self.parse_method_call(var_name)
+        return 'ID', var_name
+
+    def parse_function_call(self):
+        """
+        parse a function call including its arguments
+
+        return:
+            tuple: tuple representing the function call including the function name and its arguments
+        """
+        func_name = self.consume('FUNC')
+        self.consume('OP')  # '('
+        args = []
+        if self.current_token()[0] != 'OP' or self.current_token()[1] != ')':
+            args.append(self.parse_expression())
+            while self.current_token() and self.current_token()[0] == 'COMMA':
+                self.consume('COMMA')
+                args.append(self.parse_expression())
+        self.consume('OP')  # ')'
+        return 'CALL', func_name, tuple(args)
+
+    def parse_method_call(self, obj_name):
+        """
+        parse a method call on an object including its arguments
+
+        parameter:
+            obj_name (str): name of the object on which the method is called
+
+        return:
+            tuple: tuple representing the method call including the object name, method name and arguments
+        """
+        self.consume('DOT')
+        method_name = self.consume('ID')
+        self.consume('OP')  # '('
+        args = []
+        if self.current_token()[0] != 'OP' or self.current_token()[1] != ')':
+            args.append(self.parse_expression())
+            while self.current_token()[0] == 'COMMA':
+                self.consume('COMMA')
+                args.append(self.parse_expression())
+        self.consume('OP')  # ')'
+        return 'METHOD_CALL', obj_name, method_name, tuple(args)
+
+    def parse_class_instantiation(self):
+        """
+        parse a class instantiation including its arguments
+
+        return:
+            tuple: tuple representing the class instantiation including the class name and its arguments
+        """
+        class_name = self.consume('Class')
+        self.consume('OP')  # '('
+        args = []
+        if self.current_token()[0] != 'OP' or self.current_token()[1] != ')':
+            args.append(self.parse_expression())
+            while self.current_token()[0] == 'COMMA':
+                self.consume('COMMA')
+                args.append(self.parse_expression())
+        self.consume('OP')  # ')'
+        return 'CLASS_INST', class_name, tuple(args)
+
+    def parse_bool_statement(self):
+        """
+        parse a boolean statement from the tokens
+
+        return:
+            bool_statement (tuple): tuple representing the parsed boolean statement
+        """
+        bool_expr = self.parse_expression()
+        return 'BOOL', bool_expr
+
+    def parse_if_statement(self):
+        """
+        parse if statement including the condition, if-body, and optional else-body
+        handle both cases of if (alone) and if-else
+
+        return:
+            tuple: tuple representing the if statement structure
+        """
+        self.consume('IF')
+        self.consume('OP')  # '('
+        condition = self.parse_expression()
+        self.consume('OP')  # ')'
+        self.consume('OP')  # '{'
+        if_body = []
+        while self.current_token() and not (self.current_token()[0] == 'OP' and self.current_token()[1] == '}'):
+            stmt = self.parse_statement()
+            if stmt is not None:
+                if_body.append(stmt)
+        self.consume('OP')  # '}'
+
+        if self.current_token() and self.current_token()[0] == 'ELSE':
+            self.consume('ELSE')
+            self.consume('OP')  # '{'
+            else_body = []
+            while self.current_token() and not (self.current_token()[0] == 'OP' and self.current_token()[1] == '}'):
+                stmt = self.parse_statement()
+                if stmt is not None:
+                    else_body.append(stmt)
+            self.consume('OP')  # '}'
+            return 'IF_ELSE', condition, if_body, else_body
+
+        return 'IF', condition, if_body
+
+    def parse_while_statement(self):
+        """
+        parse a while loop including the condition and loop body
+
+        return:
+            tuple: tuple representing the while loop structure
+        """
+        self.consume('LOOP')  # 'while'
+        self.consume('OP')  # '('
+        condition = self.parse_expression()
+        self.consume('OP')  # ')'
+        self.consume('OP')  # '{'
+        while_body = []
+        while self.current_token() and not (self.current_token()[0] == 'OP' and self.current_token()[1] == '}'):
+            stmt = self.parse_statement()
+            if stmt is not None:  # This line ensures that comments (which are None) are not added to the body
+                while_body.append(stmt)
+        self.consume('OP')  # '}'
+        return 'WHILE', condition, while_body
+
+    def parse_for_statement(self):
+        """
+        parse a for loop including initialization, condition, increment and loop body
+
+        return:
+            tuple: tuple representing for loop structure
+        """
+        self.consume('LOOP')  # 'for'
+        self.consume('OP')  # '('
+
+        # Parse initialization
+        init_var = self.consume('ID')
+        self.consume('ASSIGN')
+        init_expr = self.parse_expression()
+        self.consume('SEMICOLON')
+
+        # Parse condition
+        condition = self.parse_expression()
+        self.consume('SEMICOLON')
+
+        # Parse increment
+        incr_var = self.consume('ID')
+        self.consume('ASSIGN')
+        incr_expr = self.parse_expression()
+
+        self.consume('OP')  # ')'
+        self.consume('OP')  # '{'
+
+        for_body = []
+        while self.current_token() and not (self.current_token()[0] == 'OP' and self.current_token()[1] == '}'):
+            stmt = self.parse_statement()
+            if stmt is not None:
+                for_body.append(stmt)
+        self.consume('OP')  # '}'
+
+        init = ('ASSIGN', init_var, init_expr)
+        increment = ('ASSIGN', incr_var, incr_expr)
+        return 'FOR', init, condition, increment, for_body
+
+
+class Interpreter:
+    """
+    the interpreter class is responsible for executing the abstract syntax tree
+    generated by the parser. It handles variable assignment, control flow, and
+    expression evaluation.
+
+    every AST node is compiled once into a closure, so the dispatch on the node
+    shape happens a single time instead of on every execution of the statement
+
+    variable names are resolved to integer slot indices while compiling, so a
+    variable read or write at run time is one list indexing instead of a dict
+    lookup by name
+
+    Attributes:
+        _slots (dict): maps variable names to their slot index
+        _slot_values (list): slot storage holding the variable values
+        math (mathforlanguage): instance of math operations class
+    """
+
+    __slots__ = ('_slots', '_slot_values', 'math', '_operators',
+                 '_statement_table', '_method_cache')
+
+    def __init__(self):
+        """
+        initializes the interpreter with empty variable slots and a
+        math operations instances.
+        """
+        self._slots = {}  # variable name -> slot index, filled at compile time
+        self._slot_values = []
+        self.math = mathforlanguage()
+        # (type, method name) -> function, so repeated method calls skip the
+        # full attribute lookup after the first one
+        self._method_cache = {}
+        # operator symbols bound to their implementations once, so compiled
+        # expressions call them directly instead of re-dispatching on the
+        # operator string every evaluation. the plain arithmetic, comparison
+        # and logical operators go straight to the C-implemented operator
+        # module (their math methods were one-line wrappers around the same
+        # expression); Equal and notEqual stay on math for their
+        # dictionary-lookup semantics on string operands
+        self._operators = {
+            '+': operator.add, '-': operator.sub,
+            '*': operator.mul, '/': operator.truediv,
+            '^': operator.pow,
+            '==': self.math.Equal, '!=': self.math.notEqual,
+            '<': operator.lt, '>': operator.gt,
+            '&&': operator.and_, '||': operator.or_,
+        }
+        # statement compilers keyed by node tag, replacing the if/elif chain
+        # in compile_statement with one dict lookup
+        self._statement_table = {
+            'ASSIGN': self.compile_assignment,
+            'IF': self.compile_if_else,
+            'IF_ELSE': self.compile_if_else,
+            'WHILE': self.compile_while,
+            'FOR': self.compile_for,
+            'METHOD_CALL': self._compile_method_statement,
+            'CLASS_INST': self._compile_inst_statement,
+            'ID': self._compile_id_statement,
+            'BREAK': self._compile_flow_statement,
+            'CONTINUE': self._compile_flow_statement,
+        }
+
+    @property
+    def variables(self):
+        """
+        dictionary view of the currently defined variables, kept for the
+        project tester and anyone poking at the interpreter from outside
+
+        return:
+            dict: variable names mapped to their values
+        """
+        return {name: self._slot_values[index] for name, index in self._slots.items()
+                if self._slot_values[index] is not _UNDEFINED}
+
+    def _slot_of(self, name):
+        """
+        return the slot index of a variable name, allocating a new slot the
+        first time the name is seen
+
+        parameter:
+            name (str): the variable name
+
+        return:
+            int: index of the variable in _slot_values
+        """
+        index = self._slots.get(name)
+        if index is None:
+            index = len(self._slot_values)
+            self._slots[name] = index
+            self._slot_values.append(_UNDEFINED)
+        return index
+
+    def interpret(self, ast):
+        """
+        interprets the entire AST by compiling each statement into a closure
+        and executing the closures in order.
+
+        parameter:
+            ast (list): The abstract syntax tree to be interpreted
+        """
+        program = self.compile_body(ast)
+        for stmt_fn in program:
+            stmt_fn()
+
+    def compile_body(self, statements):
+        """
+        compiles a list of statements into a list of closures, dropping
+        comments and empty entries so execution never touches them. every
+        statement is told which names the statements after it still read, so
+        if/else scope cleanup can be decided at compile time.
+
+        parameter:
+            statements (list): statements to compile
+
+        Returns:
+            list: closures, one per executable statement
+        """
+        # names referenced after each statement, built back to front
+        suffix = set()
+        referenced_after = [frozenset()] * len(statements)
+        for index in range(len(statements) - 1, -1, -1):
+            referenced_after[index] = frozenset(suffix)
+            self._collect_names(statements[index], suffix)
+
+        compiled = []
+        for index, statement in enumerate(statements):
+            compiled.append(self.compile_statement(statement, referenced_after[index]))
+        return compiled
+
+    def _collect_names(self, node, names):
+        """
+        collect every variable name an AST node references or assigns into
+        the given set
+
+        parameter:
+            node: AST node (or list of nodes) to walk
+            names (set): collects the variable names
+        """
+        if isinstance(node, (tuple, list)):
+            if isinstance(node, tuple) and node:
+                tag = node[0]
+                if tag in ('ID', 'ASSIGN', 'METHOD_CALL'):
+                    names.add(node[1])
+            for item in node:
+                self._collect_names(item, names)
+
+    def compile_statement(self, statement, referenced_after=frozenset()):
+        """
+        compiles a single statement into a closure based on its type, so the
+        type dispatch runs once instead of on every execution.
+
+        parameter:
+            statement (tuple): a tuple representing the statement to compile
+            referenced_after (frozenset): variable names read by statements
+                that follow this one in the enclosing block
+
+        Returns:
+            a closure executing the statement
+        """
+        compiler = self._statement_table.get(statement[0])
+        if compiler is None:
+            # bare expression statements (squareRoot(4)~ or 5 + 3~) have no
+            # table entry; evaluate them for whatever effect they may have
+            return self.compile_expression(statement)
+        return compiler(statement, referenced_after)
+
+    def _compile_method_statement(self, statement, referenced_after=frozenset()):
+        """
+        compiles a method call appearing as a statement of its own
+        """
+        return self.compile_method_call(statement)
+
+    def _compile_inst_statement(self, statement, referenced_after=frozenset()):
+        """
+        compiles a class instantiation appearing as a statement of its own
+        """
+        return self.compile_class_instantiation(statement)
+
+    def _compile_id_statement(self, statement, referenced_after=frozenset()):
+        """
+        compiles a bare variable reference statement
+        """
+        var_name = statement[1]
+        slot = self._slot_of(var_name)
+
+        def run_id_statement():
+            value = self._slot_values[slot]
+            if value is _UNDEFINED:
+                raise NameError(f"Name '{var_name}' is not defined")
+            return value
+        return run_id_statement
+
+    def _compile_flow_statement(self, statement, referenced_after=frozenset()):
+        """
+        compiles a break or continue statement into a closure returning its
+        control sentinel for the enclosing loop to act on
+        """
+        sentinel = _BREAK if statement[0] == 'BREAK' else _CONTINUE
+
+        def run_flow():
+            return sentinel
+        return run_flow
+
+    def compile_assignment(self, statement, referenced_after=frozenset()):
+        """
+        compiles an assignment statement into a closure that stores the value
+        in the target variable's slot.
+
+        Parameter:
+            statement (tuple): the assignment statement to compile
+            referenced_after (frozenset): unused, accepted so every statement
+                compiler shares one signature
+
+        This method handles different types of assignments
+        and variable references.
+        """
+        _, var_name, expr = statement
+        target_slot = self._slot_of(var_name)
+
+        # counting assignments like i = i + 1 collapse to one slot read, an
+        # int add and one slot store, skipping the generic closure chain
+        if (isinstance(expr, tuple) and expr[0] in ('+', '-')
+                and isinstance(expr[1], tuple) and expr[1][0] == 'ID'
+                and isinstance(expr[2], tuple) and expr[2][0] == 'NUMBER'):
+            source_slot = self._slot_of(expr[1][1])
+            step = int(expr[2][1])
+            if expr[0] == '-':
+                step = -step
+
+            def run_increment():
+                value = self._slot_values[source_slot]
+                self._slot_values[target_slot] = (0 if value is _UNDEFINED else value) + step
+            return run_increment
+
+        if isinstance(expr, tuple) and expr[0] == 'ID':
+            var_name_expr = expr[1]
+            source_slot = self._slot_of(var_name_expr)
+
+            def value_fn():
+                value = self._slot_values[source_slot]
+                if value is _UNDEFINED:
+                    raise NameError(f"Name '{var_name_expr}' is not defined")
+                return value
+        else:
+            value_fn = self.compile_expression(expr, in_assignment=True)
+
+        def run_assignment():
+            value = value_fn()
+            if isinstance(value, StringBeans):
+                self._slot_values[target_slot] = value.__copy__()
+            else:
+                self._slot_values[target_slot] = value
+        return run_assignment
+
+    def compile_if_else(self, statement, referenced_after=frozenset()):
+        """
+        compiles an if-else statement, handling both if and if-else constructs.
+
+        parameter:
+            statement (tuple): the if or if-else statement to compile
+            referenced_after (frozenset): variable names read by statements
+                that follow this one in the enclosing block
+
+        variables a branch assigns that nothing after the statement reads are
+        computed here, once, so the closure only pops that fixed set instead
+        of scanning the AST after every execution.
+        """
+        if statement[0] == 'IF':
+            _, condition, if_body = statement
+            else_body = []
+        else:  # IF_ELSE
+            _, condition, if_body, else_body = statement
+
+        condition_fn = self.compile_expression(condition)
+        if_compiled, if_assigned = self.compile_branch(if_body, referenced_after)
+        else_compiled, else_assigned = self.compile_branch(else_body, referenced_after)
+
+        # slots each branch assigns that are dead once the statement is over;
+        # they are kept per branch so only the branch that ran gets cleaned
+        if_dead = tuple(self._slot_of(name) for name in set(if_assigned)
+                        if name not in referenced_after)
+        else_dead = tuple(self._slot_of(name) for name in set(else_assigned)
+                          if name not in referenced_after)
+
+        def run_if_else():
+            slot_values = self._slot_values
+            if condition_fn():
+                branch, dead_slots = if_compiled, if_dead
+            else:
+                branch, dead_slots = else_compiled, else_dead
+
+            # only names the branch is about to create get removed afterwards;
+            # variables bound before the statement persist
+            created = [slot for slot in dead_slots if slot_values[slot] is _UNDEFINED]
+            for stmt_fn in branch:
+                result = stmt_fn()
+                if result is _BREAK or result is _CONTINUE:
+                    return result
+
+            # remove branch variables that are not used after the block
+            for slot in created:
+                slot_values[slot] = _UNDEFINED
+
+            return None
+        return run_if_else
+
+    def compile_branch(self, body, referenced_after=frozenset()):
+        """
+        compiles an if or else block into closures plus the list of names the
+        block assigns at its top level.
+
+        parameter:
+            body (list): statements of the branch
+            referenced_after (frozenset): variable names read by statements
+                that follow the whole if statement
+
+        Returns:
+            tuple: (list of closures, list of assigned names)
+        """
+        suffix = set()
+        branch_refs = [frozenset()] * len(body)
+        for index in range(len(body) - 1, -1, -1):
+            branch_refs[index] = frozenset(suffix | referenced_after)
+            self._collect_names(body[index], suffix)
+
+        compiled = []
+        assigned = []
+        for index, stmt in enumerate(body):
+            stmt_fn = self.compile_statement(stmt, branch_refs[index])
+            if stmt[0] == 'ASSIGN':
+                assigned.append(stmt[1])
+            compiled.append(stmt_fn)
+        return compiled, assigned
+
+    def compile_while(self, statement, referenced_after=frozenset()):
+        """
+        compiles a while loop statement.
+
+        parameter:
+            statement (tuple): while loop statement to compile
+            referenced_after (frozenset): variable names read by statements
+                that follow this one in the enclosing block
+
+        the returned closure manages the execution of the pre-compiled loop
+        body, handling break and continue statements, and removes variables
+        created within the loop after execution.
+        """
+        _, condition, body = statement
+        native_fn = self._compile_native_loop(statement, condition, body)
+        if native_fn is not None:
+            return native_fn
+        condition_fn = self.compile_expression(condition)
+        body_compiled, assigned_names = self.compile_loop_body(body, statement, referenced_after)
+        assigned_slots = tuple(self._slot_of(name) for name in set(assigned_names))
+
+        def run_while():
+            slot_values = self._slot_values
+            # variables the body assigns that don't exist yet are created by the loop
+            loop_slots = [slot for slot in assigned_slots if slot_values[slot] is _UNDEFINED]
+
+            while condition_fn():
+                should_break = False
+                should_continue = False
+                for tag, stmt_fn in body_compiled:
+                    if tag is _BREAK:
+                        should_break = True
+                        break
+                    elif tag is _CONTINUE:
+                        should_continue = True
+                        break
+                    result = stmt_fn()
+                    if result is _BREAK:
+                        should_break = True
+                        break
+                    elif result is _CONTINUE:
+                        should_continue = True
+                        break
+                if should_break:
+                    break
+                if should_continue:
+                    continue
+
+            # remove variables created inside the loop
+            for slot in loop_slots:
+                slot_values[slot] = _UNDEFINED
+        return run_while
+
+    def compile_for(self, statement, referenced_after=frozenset()):
+        """
+        compiles a for loop statement.
+
+        parameter:
+            statement (tuple): for a loop statement to compile
+            referenced_after (frozenset): variable names read by statements
+                that follow this one in the enclosing block
+
+        the returned closure manages the execution of the pre-compiled loop
+        body, handling break and continue statements and removes variables
+        created within the loop after execution.
+        """
+        _, init, condition, increment, body = statement
+        vector_fn = self._try_vectorize_for(statement, init, condition, increment, body)
+        if vector_fn is not None:
+            return vector_fn
+        native_fn = self._compile_native_loop(statement, condition, body, init, increment)
+        if native_fn is not None:
+            return native_fn
+        counter_slot = self._slot_of(init[1])
+        init_fn = self.compile_assignment(init)
+        condition_fn = self.compile_expression(condition)
+        increment_fn = self.compile_assignment(increment)
+        body_compiled, assigned_names = self.compile_loop_body(body, statement, referenced_after)
+        assigned_slots = tuple(self._slot_of(name) for name in set(assigned_names))
+
+        def run_for():
+            slot_values = self._slot_values
+
+            # check if the loop counter-variable already exists in the global scope
+            loop_counter_exists = slot_values[counter_slot] is not _UNDEFINED
+
+            init_fn()
+
+            # variables the body assigns that don't exist yet are created by the loop
+            loop_slots = [slot for slot in assigned_slots
+                          if slot != counter_slot and slot_values[slot] is _UNDEFINED]
+
+            while condition_fn():
+                should_break = False
+                should_continue = False
+                for tag, stmt_fn in body_compiled:
+                    if tag is _BREAK:
+                        should_break = True
+                        break
+                    elif tag is _CONTINUE:
+                        should_continue = True
+                        break
+                    result = stmt_fn()
+                    if result is _BREAK:
+                        should_break = True
+                        break
+                    elif result is _CONTINUE:
+                        should_continue = True
+                        break
+
+                if should_break:
+                    break
+
+                # execute the increment statement even if continue was encountered
+                increment_fn()
+
+                if should_continue:
+                    continue
+
+            # Remove variables created inside the loop
+            for slot in loop_slots:
+                slot_values[slot] = _UNDEFINED
+
+            # Remove the loop counter variable if it was created within the loop
+            if not loop_counter_exists:
+                slot_values[counter_slot] = _UNDEFINED
+        return run_for
+
+    def compile_loop_body(self, body, statement, referenced_after=frozenset()):
+        """
+        compiles a loop body into (sentinel, closure) pairs plus the list of
+        names the body assigns, so the loop closure can recognize break and
+        continue with one identity compare and never re-inspects the AST per
+        iteration.
+
+        parameter:
+            body (list): statements of the loop body
+            statement (tuple): the enclosing loop statement
+            referenced_after (frozenset): variable names read by statements
+                that follow the loop in the enclosing block
+
+        Returns:
+            tuple: (list of (control sentinel or None, closure) pairs,
+            assigned names)
+        """
+        # every name the loop touches stays referenced for nested if cleanup,
+        # since a later iteration can read what was assigned this iteration
+        loop_names = set()
+        self._collect_names(statement, loop_names)
+        body_refs = frozenset(loop_names | referenced_after)
+
+        compiled = []
+        assigned_names = []
+        for stmt in body:
+            stmt_fn = self.compile_statement(stmt, body_refs)
+            if stmt[0] == 'BREAK':
+                tag = _BREAK
+            elif stmt[0] == 'CONTINUE':
+                tag = _CONTINUE
+            else:
+                tag = None
+            self._collect_assigned(stmt, assigned_names)
+            compiled.append((tag, stmt_fn))
+        return compiled, assigned_names
+
+    def _collect_assigned(self, statement, names):
+        """
+        collect every name a statement assigns, descending into nested
+        if/else branches, so loop cleanup also covers variables a branch
+        inside the loop creates
+
+        parameter:
+            statement (tuple): the statement to inspect
+            names (list): collects the assigned variable names
+        """
+        tag = statement[0]
+        if tag == 'ASSIGN':
+            names.append(statement[1])
+        elif tag == 'IF':
+            for stmt in statement[2]:
+                self._collect_assigned(stmt, names)
+        elif tag == 'IF_ELSE':
+            for stmt in statement[2]:
+                self._collect_assigned(stmt, names)
+            for stmt in statement[3]:
+                self._collect_assigned(stmt, names)
+
+    def _vector_expr(self, expr, counter):
+        """
+        builds a function evaluating an expression over a numpy index array.
+
+        parameter:
+            expr: the expression to translate
+            counter (str): name of the loop counter the expression may read
+
+        Returns:
+            a function taking the index array and returning the elementwise
+            values, or None when the expression reads other variables or
+            uses an operator numpy can't map directly
+        """
+        if not isinstance(expr, tuple):
+            return None
+        tag = expr[0]
+        if tag == 'ID':
+            if expr[1] != counter:
+                return None
+            return lambda arr: arr
+        if tag == 'NUMBER':
+            value = int(expr[1])
+            return lambda arr: value
+        if tag in ('+', '-', '*', '/', '^'):
+            left_fn = self._vector_expr(expr[1], counter)
+            right_fn = self._vector_expr(expr[2], counter)
+            if left_fn is None or right_fn is None:
+                return None
+            op = {'+': numpy.add, '-': numpy.subtract, '*': numpy.multiply,
+                  '/': numpy.divide, '^': numpy.power}[tag]
+            return lambda arr: op(left_fn(arr), right_fn(arr))
+        return None
+
+    def _try_vectorize_for(self, statement, init, condition, increment, body):
+        """
+        lowers a counting for loop that only accumulates into one variable
+        to a single numpy reduction.
+
+        recognizes the shape for(i = a; i < b; i = i + 1) { x = x + f(i)~ }
+        where f reads nothing but the counter and literals, and replaces the
+        whole loop with x = x + sum(f(a..b-1)) computed in one vectorized
+        call.
+
+        parameter:
+            statement (tuple): the FOR statement being compiled
+            init (tuple): the init assignment
+            condition: the loop condition expression
+            increment (tuple): the increment assignment
+            body (list): statements of the loop body
+
+        Returns:
+            a closure running the reduction, or None when numpy is missing
+            or the loop doesn't match the shape
+        """
+        if numpy is None:
+            return None
+        counter = init[1]
+        if not (isinstance(init[2], tuple) and init[2][0] == 'NUMBER'):
+            return None
+        start = int(init[2][1])
+        if not (isinstance(condition, tuple) and condition[0] == '<'
+                and condition[1] == ('ID', counter)
+                and isinstance(condition[2], tuple) and condition[2][0] == 'NUMBER'):
+            return None
+        stop = int(condition[2][1])
+        if increment != ('ASSIGN', counter, ('+', ('ID', counter), ('NUMBER', '1'))):
+            return None
+        if len(body) != 1 or body[0][0] != 'ASSIGN':
+            return None
+        accumulator = body[0][1]
+        value_expr = body[0][2]
+        if accumulator == counter:
+            return None
+        if not (isinstance(value_expr, tuple) and value_expr[0] == '+'
+                and value_expr[1] == ('ID', accumulator)):
+            return None
+        term_fn = self._vector_expr(value_expr[2], counter)
+        if term_fn is None:
+            return None
+
+        # the reduction runs in int64, which wraps silently where the
+        # interpreter is exact; the bounds are literals, so bound the term
+        # analytically from the endpoints instead of materializing the range
+        count = stop - start
+        # past a few million elements the index range costs more memory than
+        # the reduction is worth; the lowered loop handles those instead
+        if count > 2 ** 22:
+            return None
+        if count > 0:
+            term_bound = self._lowered_bound(value_expr[2], max(abs(start), abs(stop - 1)))
+            if term_bound is None:
+                return None
+            term_int, peak = term_bound
+            # int64 partial sums must stay in range; float terms never wrap
+            if term_int and peak * count >= 2 ** 62:
+                return None
+        accumulator_slot = self._slot_of(accumulator)
+        counter_slot = self._slot_of(counter)
+
+        def run_vector_for():
+            slot_values = self._slot_values
+            counter_exists = slot_values[counter_slot] is not _UNDEFINED
+
+            slot_values[counter_slot] = start
+            if start < stop:
+                arr = numpy.arange(start, stop)
+                total = numpy.broadcast_to(term_fn(arr), arr.shape).sum().item()
+                accumulator_created = slot_values[accumulator_slot] is _UNDEFINED
+                base = 0 if accumulator_created else slot_values[accumulator_slot]
+                result = base + total
+                slot_values[accumulator_slot] = result
+                slot_values[counter_slot] = stop
+                if accumulator_created:
+                    slot_values[accumulator_slot] = _UNDEFINED
+
+            if not counter_exists:
+                slot_values[counter_slot] = _UNDEFINED
+        return run_vector_for
+
+    def _lower_numeric_expr(self, expr, names, comparison=False):
+        """
+        translate a pure numeric expression AST into python source text,
+        recording the variable names it reads in the given set.
+
+        parameter:
+            expr: the expression to translate
+            names (set): collects the variable names the expression uses
+            comparison (bool): allow a top-level < or >, which is only
+                wanted for loop conditions
+
+        Returns:
+            str: python source for the expression, or None if it contains
+            anything that is not numeric arithmetic over plain variables
+        """
+        if isinstance(expr, tuple):
+            op = expr[0]
+            # == and != stay on the generic path: Equal resolves string
+            # operands through the math Dict, which plain operators drop.
+            # < and > only lower inside conditions: as assignment values
+            # they produce bools, which the int64 kernel would turn into
+            # 0/1 where the interpreter stores True/False
+            if op in ('<', '>') and not comparison:
+                return None
+            if op in ('+', '-', '*', '/', '<', '>'):
+                left = self._lower_numeric_expr(expr[1], names)
+                right = self._lower_numeric_expr(expr[2], names)
+                if left is None or right is None:
+                    return None
+                return f'({left} {op} {right})'
+            elif op == '^':
+                left = self._lower_numeric_expr(expr[1], names)
+                right = self._lower_numeric_expr(expr[2], names)
+                if left is None or right is None:
+                    return None
+                return f'({left} ** {right})'
+            elif op == 'ID':
+                names.add(expr[1])
+                return 'v_' + expr[1]
+            elif op == 'NUMBER':
+                # float literals stay on the generic path, which also keeps
+                # the int64 guard arithmetic below integer-only
+                if '.' in expr[1]:
+                    return None
+                return str(int(expr[1]))
+        return None
+
+    def _lowered_bound(self, expr, var_bound):
+        """
+        puts a conservative magnitude bound on a lowered expression, assuming
+        every variable it reads stays within var_bound.
+
+        parameter:
+            expr: the expression AST to bound
+            var_bound (int): magnitude every variable is assumed to stay in
+
+        Returns:
+            tuple: (is_int, bound) where is_int says whether the expression
+            stays integer typed, or None when it cannot be proven to stay
+            inside int64 under that assumption
+        """
+        if not isinstance(expr, tuple):
+            return None
+        op = expr[0]
+        if op == 'ID':
+            return True, var_bound
+        if op == 'NUMBER':
+            bound = abs(int(expr[1]))
+            return (True, bound) if bound < 2 ** 63 else None
+        left = self._lowered_bound(expr[1], var_bound)
+        right = self._lowered_bound(expr[2], var_bound)
+        if left is None or right is None:
+            return None
+        left_int, left_bound = left
+        right_int, right_bound = right
+        if op in ('<', '>'):
+            return True, 1
+        if op in ('+', '-'):
+            is_int, bound = left_int and right_int, left_bound + right_bound
+        elif op == '*':
+            is_int, bound = left_int and right_int, left_bound * right_bound
+        elif op == '/':
+            # true division always produces floats, which never wrap
+            is_int, bound = False, 0
+        elif op == '^':
+            if not (isinstance(expr[2], tuple) and expr[2][0] == 'NUMBER'):
+                return None
+            exponent = int(expr[2][1])
+            if exponent < 0:
+                return None
+            # capping the exponent keeps the bound computation cheap; any
+            # int base above 1 raised past 64 fails the int64 check anyway
+            is_int, bound = left_int, left_bound ** min(exponent, 64)
+        else:
+            return None
+        if is_int and bound >= 2 ** 63:
+            return None
+        return is_int, bound
+
+    def _compile_native_loop(self, statement, condition, body, init=None, increment=None):
+        """
+        tries to lower a loop whose condition and body are pure numeric
+        assignments into one generated python function, so the whole loop runs
+        as native bytecode instead of a closure call per statement per
+        iteration. when numba is installed the generated function is
+        JIT-compiled on top of that.
+
+        parameter:
+            statement (tuple): the WHILE or FOR statement being compiled
+            condition: the loop condition expression
+            body (list): statements of the loop body
+            init (tuple): the init assignment of a for loop, or None
+            increment (tuple): the increment assignment of a for loop, or None
+
+        Returns:
+            a closure running the lowered loop, or None when the loop uses
+            anything beyond numeric arithmetic (strings, method calls, break,
+            nested statements and so on) and must use the generic path
+        """
+        names = set()
+        cond_src = self._lower_numeric_expr(condition, names, comparison=True)
+        if cond_src is None:
+            return None
+        body_lines = []
+        targets = []
+        for stmt in body:
+            if stmt[0] != 'ASSIGN':
+                return None
+            value_src = self._lower_numeric_expr(stmt[2], names)
+            if value_src is None:
+                return None
+            targets.append(stmt[1])
+            names.add(stmt[1])
+            body_lines.append(f'v_{stmt[1]} = {value_src}')
+        if not body_lines:
+            return None
+
+        loop_counter = None
+        init_line = None
+        increment_line = None
+        if init is not None:
+            init_src = self._lower_numeric_expr(init[2], names)
+            increment_src = self._lower_numeric_expr(increment[2], names)
+            if init_src is None or increment_src is None:
+                return None
+            loop_counter = init[1]
+            names.add(init[1])
+            names.add(increment[1])
+            targets.append(increment[1])
+            init_line = f'v_{init[1]} = {init_src}'
+            increment_line = f'v_{increment[1]} = {increment_src}'
+
+        # generate the loop as one plain python function over the variables
+        ordered = sorted(names)
+        params = ', '.join('v_' + name for name in ordered)
+        lines = [f'def _native_loop({params}):']
+        if init_line is not None:
+            lines.append('    ' + init_line)
+        lines.append(f'    while {cond_src}:')
+        lines.extend('        ' + line for line in body_lines)
+        if increment_line is not None:
+            lines.append('        ' + increment_line)
+        lines.append(f'    return ({params},)')
+        namespace = {}
+        exec('\n'.join(lines), namespace)
+        loop_fn = namespace['_native_loop']
+
+        # the jit runs in int64, which wraps silently (and can even trap the
+        # loop in a wrap cycle), so it is only entered when every expression
+        # provably stays inside int64 while all variables stay within a
+        # guard magnitude, re-checked in the kernel each iteration
+        guard_exprs = [condition] + [stmt[2] for stmt in body]
+        if init is not None:
+            guard_exprs.append(init[2])
+            guard_exprs.append(increment[2])
+        jit_fn = None
+        guard = None
+        if numba is not None:
+            for shift in (62, 47, 31, 15):
+                bound = 2 ** shift
+                if all(self._lowered_bound(expr, bound) is not None
+                       for expr in guard_exprs):
+                    guard = bound
+                    break
+        if guard is not None:
+            checks = ' or '.join(f'v_{name} > {guard} or v_{name} < -{guard}'
+                                 for name in ordered)
+            guarded = [f'def _guarded_loop({params}):']
+            if init_line is not None:
+                guarded.append('    ' + init_line)
+            guarded.append('    while True:')
+            guarded.append(f'        if {checks}:')
+            guarded.append(f'            return (True, {params})')
+            guarded.append(f'        if not {cond_src}:')
+            guarded.append('            break')
+            guarded.extend('        ' + line for line in body_lines)
+            if increment_line is not None:
+                guarded.append('        ' + increment_line)
+            guarded.append(f'    return (False, {params})')
+            namespace = {}
+            exec('\n'.join(guarded), namespace)
+            # no cache=True here: the generated function has no source file,
+            # so numba's cache locator would raise instead of compiling
+            jit_fn = numba.njit(namespace['_guarded_loop'])
+        target_names = set(targets)
+        ordered_slots = [self._slot_of(name) for name in ordered]
+        counter_slot = None if loop_counter is None else self._slot_of(loop_counter)
+        writeback = [(slot, position) for position, (name, slot)
+                     in enumerate(zip(ordered, ordered_slots))
+                     if name in target_names or name == loop_counter]
+
+        def run_native_loop():
+            slot_values = self._slot_values
+            loop_counter_exists = counter_slot is None or slot_values[counter_slot] is not _UNDEFINED
+            # variables the body assigns that don't exist yet are created by the loop
+            loop_slots = [slot for slot, position in writeback
+                          if slot != counter_slot and slot_values[slot] is _UNDEFINED]
+
+            args = [0 if slot_values[slot] is _UNDEFINED else slot_values[slot]
+                    for slot in ordered_slots]
+            results = None
+            if jit_fn is not None and all(-guard <= value <= guard for value in args):
+                # any jit failure (an argument numba cannot type, int **
+                # negative, a tripped guard) falls back to exact python
+                try:
+                    jitted = jit_fn(*args)
+                except Exception:
+                    jitted = None
+                if jitted is not None and not jitted[0]:
+                    results = jitted[1:]
+            if results is None:
+                results = loop_fn(*args)
+
+            for slot, position in writeback:
+                slot_values[slot] = results[position]
+            for slot in loop_slots:
+                slot_values[slot] = _UNDEFINED
+            if not loop_counter_exists:
+                slot_values[counter_slot] = _UNDEFINED
+        return run_native_loop
+
+    def compile_method_call(self, expr, in_assignment=False):
+        """
+        compiles a method call into a closure.
+
+        whether the call sits inside an assignment is known here at compile
+        time, so the closure never has to inspect the running statement:
+        display and splitBeans print their result only outside assignments.
+
+        parameter:
+            expr (tuple): The method call node to compile
+            in_assignment (bool): True when the call is part of an
+                assignment's right-hand side
+
+        """
+        _, obj_name, method_name, args = expr
+        arg_fns = tuple(self.compile_expression(arg, in_assignment) for arg in args)
+        obj_slot = self._slot_of(obj_name)
+
+        # the arity is fixed at compile time, so the common small-arity calls
+        # pass their arguments directly with no argument list allocation
+        if not arg_fns:
+            def invoke(method, obj):
+                return method(obj)
+        elif len(arg_fns) == 1:
+            arg_fn = arg_fns[0]
+
+            def invoke(method, obj):
+                return method(obj, arg_fn())
+        elif len(arg_fns) == 2:
+            first_fn, second_fn = arg_fns
+
+            def invoke(method, obj):
+                return method(obj, first_fn(), second_fn())
+        else:
+            def invoke(method, obj):
+                return method(obj, *[arg_fn() for arg_fn in arg_fns])
+
+        def run_method_call():
+            obj = self._slot_values[obj_slot]
+            if obj is _UNDEFINED or obj is None:
+                raise NameError(f"Name '{obj_name}' is not defined")
+
+            key = (obj.__class__, method_name)
+            method = self._method_cache.get(key)
+            if method is None:
+                # cache the function off the type so it is shared by every
+                # instance of that class
+                method = getattr(obj.__class__, method_name, None)
+                if method is None:
+                    raise AttributeError(f"'{type(obj).__name__}' object has no attribute '{method_name}'")
+                self._method_cache[key] = method
+
+            return invoke(method, obj)
+
+        if in_assignment:
+            return run_method_call
+
+        if method_name == 'display':
+            def run_display_call():
+                result = run_method_call()
+                print(f"{obj_name} = {result}")
+                return result
+            return run_display_call
+
+        if method_name == 'splitBeans':
+            def run_split_call():
+                # when splitBeans is called without assignment we'll print the result
+                result = run_method_call()
+                print(f"{result.display()}")
+                return result
+            return run_split_call
+
+        return run_method_call
+
+    def compile_expression(self, expr, in_assignment=False):
+        """
+        compiles an expression into a closure that returns its value.
+
+        parameter:
+            expr: The expression to compile
+            in_assignment (bool): True when the expression is evaluated as
+                part of an assignment's right-hand side, threaded down to
+                method calls so they know not to print
+
+        this method handles various types of expressions, including math
+        operations, functions, and variables. literals are converted to their
+        value once at compile time.
+        """
+        if isinstance(expr, tuple):
+            op = expr[0]
+            if op in self._operators:
+                folded = self._fold_numeric(expr)
+                if folded is not None:
+                    return lambda: folded
+                left_fn = self.compile_expression(expr[1], in_assignment)
+                right_fn = self.compile_expression(expr[2], in_assignment)
+                op_fn = self._operators[op]  # bound once, no dispatch at run time
+                if op in ('&&', '||'):
+                    to_bool = self.to_bool  # bound once, not per evaluation
+
+                    def run_logical():
+                        return op_fn(to_bool(left_fn()), to_bool(right_fn()))
+                    return run_logical
+                if op in ('==', '!='):
+                    def run_compare():
+                        left = left_fn()
+                        right = right_fn()
+                        if type(left) is str or type(right) is str:
+                            # Equal resolves literal operands through the math
+                            # dictionary, synced only when actually needed
+                            self.math.updateDict(self.variables)
+                        return op_fn(left, right)
+                    return run_compare
+
+                def run_binary():
+                    return op_fn(left_fn(), right_fn())
+                return run_binary
+            elif op == 'CALL':
+                return self.compile_function_call(expr, in_assignment)
+            elif op == 'METHOD_CALL':
+                return self.compile_method_call(expr, in_assignment)
+            elif op == 'CLASS_INST':
+                return self.compile_class_instantiation(expr, in_assignment)
+            elif op == 'ID':
+                slot = self._slot_of(expr[1])
+
+                def run_id():
+                    value = self._slot_values[slot]
+                    return 0 if value is _UNDEFINED else value
+                return run_id
+            elif op == 'NUMBER':
+                value = int(expr[1])
+                return lambda: value
+            elif op == 'BOOL':
+                value = expr[1] == 'True'
+                return lambda: value
+            elif op == 'CHAR':
+                value = expr[1].strip('"')
+                return lambda: value
+        return lambda: expr
+
+    def _fold_numeric(self, expr):
+        """
+        evaluates a subtree built only from number literals once at compile
+        time.
+
+        parameter:
+            expr: the expression to try to fold
+
+        Returns:
+            the constant value of the subtree, or None if it reads variables,
+            calls anything, or cannot be evaluated safely ahead of time
+        """
+        if isinstance(expr, tuple):
+            op = expr[0]
+            if op == 'NUMBER':
+                try:
+                    return int(expr[1])
+                except ValueError:
+                    return None
+            if op in ('+', '-', '*', '/', '^', '<', '>', '==', '!='):
+                left = self._fold_numeric(expr[1])
+                if left is None:
+                    return None
+                right = self._fold_numeric(expr[2])
+                if right is None:
+                    return None
+                try:
+                    return self.apply_operator(op, left, right)
+                except ZeroDivisionError:
+                    return None  # keep the error at run time, like the generic path
+        return None
+
+    def to_bool(self, value):
+        """
+        converts a value to a boolean.
+
+        parameter:
+            value: value to convert
+
+        returns:
+            bool: boolean representation of the value
+        """
+
+        if value.__class__ is str:
+            return value.lower() == 'true'
+        return bool(value)
+
+    def compile_function_call(self, expr, in_assignment=False):
+        """
+        compiles a function call into a closure with the target function
+        resolved once at compile time.
+
+        parameter:
+            expr (tuple): The function / class call expression
+            in_assignment (bool): True when the call is part of an
+                assignment's right-hand side, passed on to the arguments
+        """
+        _, func_name, args = expr
+        arg_fns = tuple(self.compile_expression(arg, in_assignment) for arg in args)
+        if func_name == 'Shmuple':
+            return lambda: Shmuple(*[arg_fn() for arg_fn in arg_fns])
+        elif func_name == 'Arrays':
+            return lambda: Arrays(arg_fns[0]())
+        elif func_name == 'StringBeans':
+            return lambda: StringBeans(arg_fns[0]())
+        elif func_name == 'squareRoot':
+            square_root = self.math.squareRoot  # bound once, not per call
+            return lambda: square_root(arg_fns[0]())
+        elif func_name == 'min':
+            math_min = self.math.Min
+            return lambda: math_min(arg_fns[0](), arg_fns[1]())
+        elif func_name == 'max':
+            math_max = self.math.Max
+            return lambda: math_max(arg_fns[0](), arg_fns[1]())
+
+        def unknown_function():
+            raise NameError(f"Function '{func_name}' is not defined")
+        return unknown_function
+
+    def compile_class_instantiation(self, statement, in_assignment=False):
+        """
+        compiles a class instantiation into a closure.
+
+        parameter:
+            statement (tuple): The class instantiation statement
+            in_assignment (bool): True when the instantiation is part of an
+                assignment's right-hand side, passed on to the arguments
+
+        the closure creates new instances of Shmuple, Arrays, or StringBeans classes.
+        """
+        _, class_name, args = statement
+        arg_fns = tuple(self.compile_expression(arg, in_assignment) for arg in args)
+        if class_name == 'Shmuple':
+            return lambda: Shmuple(*[arg_fn() for arg_fn in arg_fns])
+        elif class_name == 'Arrays':
+            return lambda: Arrays(*[arg_fn() for arg_fn in arg_fns])
+        elif class_name == 'StringBeans':
+            return lambda: StringBeans(*[arg_fn() for arg_fn in arg_fns])
+
+        def unknown_class():
+            raise NameError(f"Class '{class_name}' is not defined")
+        return unknown_class
+
+    def apply_operator(self, op, left, right):
+        """
+        applies a binary operator to two operands.
+
+        parameters:
+            op (str): the operator
+            left: the left operand
+            right: the right operand
+
+        returns:
+            the result of the operation
+        """
+        if op in ('&&', '||'):
+            return self._operators[op](self.to_bool(left), self.to_bool(right))
+        if op in ('==', '!=') and (type(left) is str or type(right) is str):
+            # Equal resolves literal operands through the math dictionary,
+            # which is only synced when such a comparison actually happens
+            self.math.updateDict(self.variables)
+        return self._operators[op](left, right)
+
+    def print_variables(self):
+        """
+        prints all variables in the current scope.
+
+        displays the contents of the variables, this function only for the project tester
+        """
+        print("Variables:")
+        for var, value in self.variables.items():
+            if isinstance(value, Shmuple):
+                print(f"{var} = {value}")
+            elif isinstance(value, Arrays):
+                print(f"{var} = {value.display()}")
+            elif isinstance(value, StringBeans):
+                print(f"{var} = {value}")
+            elif isinstance(value, str):
+                print(f"{var} = \"{value}\"")
+            else:
+                print(f"{var} = {value}")
+
+
+def parse_cached(code, verbose=False):
+    """
+    parse source text, reusing a pickled AST from an on-disk cache when the
+    same source was already parsed by an earlier run.
+
+    caching is opt-in through the MUFFASA_AST_CACHE environment variable so a
+    normal run never depends on state left behind by another one; when it is
+    off, or on a cache miss, the code is lexed and parsed right here.
+
+    parameter:
+        code (str): the source code to parse
+        verbose (bool): print the token list and AST when actually parsing
+
+    return:
+        list: the parsed AST
+
+    raise:
+        RuntimeError: propagated from the lexer or parser on bad input
+    """
+    cache_file = None
+    if os.environ.get('MUFFASA_AST_CACHE'):
+        digest = hashlib.sha1(code.encode('utf-8')).hexdigest()
+        cache_file = os.path.join(os.path.expanduser('~'), '.mufasa_cache', digest + '.ast')
+        try:
+            with open(cache_file, 'rb') as handle:
+                return pickle.load(handle)
+        except (OSError, pickle.PickleError):
+            pass  # missing or unreadable entry, parse normally below
+    tokens = Lexer(code).tokenize()
+    if verbose:
+        print("Tokens:", list(zip(*tokens)))
+    ast = Parser(tokens).parse()
+    if verbose:
+        print("AST:", ast)
+    if cache_file is not None:
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(cache_file, 'wb') as handle:
+                pickle.dump(ast, handle, pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass  # caching is best effort
+    return ast
+
+
+if __name__ == "__main__":
+    # test code
+    code1 = """
+    "בשפה הזאת אפשר לכתוב הערות כסטרינג רגיל בשורה נפרדת"
+    "כאן בדיקה לשמאפל"
+    sh = Shmuple(1, 3, 2, 0, -7)~
+    sh_sorted = sh.sortuple()~
+    sh2 = Shmuple(-8, 6)~
+    sh1 = sh.Add(sh2)~
+    sh1 = sh1.sortuple()~
+    item = sh1.getitem(5)~
+    shin = sh1.Index(0)~
+    shlen = sh1.Length()~ 
+    
+    "כאן בדיקה למערכים"
+    arr = Arrays(5)~
+    arr.add(10)~
+    arr.insert(0, "5")~
+    arr_len = arr.length()~
+    item_arr = arr.at(0)~
+    arr.remove(1)~
+    arr.display()~
+    
+    "בדיקה לסטרינגים"
+    strb = StringBeans("hello");
+    strb.show();
+    newstrb = strb;
+    strb.Replace("h", "hi");
+    strb.show();
+    newstrb.show();
+    a = newstrb.allUpper();
+    b = newstrb.allLower();
+    newstrb.Conjoin(" ast");
+    
+    "קצת פעולות אריתמטיות, תנאים ולולאות בקוד 2"
+    c = 5;
+    t = 7;
+    c = c - t;
+    u = 5*2;
+    U = t*c;
+    "add min max functionality"
+    T = min(10, 2)~
+    P = max(10, 2)~
+    L = squareRoot(100)~
+    O = c^4~
+    """
+
+    code2 = """
+    x = 520156~
+    y = 3~
+    if (x != 5)
+    {
+        z = x + y~
+    }
+    else
+    {
+        p = x - y~
+    }
+    "There is no else-if duo to the fact there was no requirement"
+    "need to fix break and comments in loops"
+    while (y < 10)
+    {
+        y = y + 1~
+        q = 5~
+    }
+    for (i = 1; i < 10 ; i = i + 1)
+    {
+        y = y + i~
+        p = y~
+    }
+    
+    l = y < x;
+    n = z > y;
+    c =  l && n;
+    e = False;
+    f = True;
+    t = e || f;
+    """
+
+    # this code supposed to fail
+    code3 = """
+    x = 1~
+    else
+    {
+        x = x + 1~
+    }
+    """
+
+    code4 = """
+    str1 = StringBeans("Hello,World,How,Are,You")~
+    arr1 = str1.splitBeans(",")~
+    arr1.display()~
+    
+    str2 = StringBeans("This is a test")~
+    arr2 = str2.splitBeans(" ")~
+    arr2.display()~
+    
+    "Test splitBeans without assignment"
+    str3 = StringBeans("One|Two|Three")~
+    str3.splitBeans("|")~
+    
+    y = 0~
+    sum = 0~
+    z = 0~
+    while (y < 10)
+    {
+        "comment1"
+        y = y + 2~
+        sum = sum + 1~
+        "comment2"
+        if (y > 3)
+        {
+            p = 400~
+        }
+        break;
+        
+    }
+    for (i = 4; i < 10 ; i = i + 1)
+    {
+        y = i + i~
+        p = y~
+        if(y < 3)
+        {
+            continue;
+        }
+        else
+        {
+            break;
+        }
+    }
+    
+"""
+
+    # create interpreter instance
+    interpreter = Interpreter()
+
+    print("Testing code1:")
+    try:
+        # parse (or fetch the cached AST) and interpret code1
+        ast1 = parse_cached(code1, verbose=True)
+        interpreter.interpret(ast1)
+        interpreter.print_variables()
+    except RuntimeError as e:
+        print(f"Error: {e}")
+
+    # create new interpreter instance for code2
+    interpreter2 = Interpreter()
+    print("Testing code2:")
+    try:
+        # parse (or fetch the cached AST) and interpret code2
+        ast2 = parse_cached(code2, verbose=True)
+        interpreter2.interpret(ast2)
+        interpreter2.print_variables()
+    except RuntimeError as e:
+        print(f"Error: {e}")
+
+    # we did not create interpreter for code3 because parser ment to fail
+    print("Testing code3:")
+    try:
+        # attempt to parse code3 (expected to fail)
+        ast3 = parse_cached(code3, verbose=True)
+    except RuntimeError as e:
+        print(f"Error: {e}")
+
+    # create a new interpreter instance for code4
+    int3 = Interpreter()
+    print("Testing code4:")
+    try:
+        # parse (or fetch the cached AST) and interpret code4
+        ast4 = parse_cached(code4, verbose=True)
+        int3.interpret(ast4)
+        int3.print_variables()
+    except RuntimeError as e:
+        print(f"Error: {e}")